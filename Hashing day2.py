@@ -3,28 +3,200 @@
 Basic Text Hashing Tool — GUI (Tkinter)
 Save as hash_gui.py and run: python hash_gui.py
 """
-import hashlib
+import functools
+import mmap
+import os
+import queue
+import threading
 import tkinter as tk
+from collections import OrderedDict
 from tkinter import ttk, filedialog, messagebox
 from pathlib import Path
 
-# optional clipboard support via pyperclip (not required)
+# optional fast non-cryptographic / modern hashes (not required)
 try:
-    import pyperclip
+    import blake3
 except Exception:
-    pyperclip = None
+    blake3 = None
+try:
+    import xxhash
+except Exception:
+    xxhash = None
 
 APP_TITLE = "Basic Text Hashing Tool (GUI) v1.0"
+# opened files are hashed from disk; only this much is shown in the editor
+PREVIEW_BYTES = 1 << 20
+# text is encoded and hashed in slices of this many characters
+HASH_CHUNK = 1 << 16
+# BLAKE3 only spreads work over threads for inputs at least this big
+BLAKE3_MT_MIN = 1 << 20
+# leaf size of the parallel SHA-256 tree; fixed so digests don't depend on the CPU
+TREE_LEAF = 1 << 20
+# show the digest that Verify had to compute even when it doesn't match
+SHOW_HASH_ON_MISMATCH = False
+# recent digests kept per (algorithm, input) so repeat Compute/Verify is free
+DIGEST_CACHE_SIZE = 16
+# pastes longer than this (chars) are kept out of the widget: the full text is
+# hashed straight from bytes and only its start is shown
+BIG_PASTE_CHARS = 1 << 18
+# how often the UI checks on a background hash (ms), and its status spinner
+POLL_MS = 50
+SPINNER = "|/-\\"
 
-def compute_hash_bytes(data: bytes, algo: str) -> str:
-    algo = algo.lower()
-    if algo == "md5":
-        h = hashlib.md5()
-    else:
-        h = hashlib.sha256()
-    h.update(data)
+# hashlib, hmac and concurrent.futures are imported on first use: loading
+# them (and OpenSSL) up front noticeably delays the window appearing
+_hashlib = None
+
+def _get_hashlib():
+    global _hashlib
+    if _hashlib is None:
+        import hashlib
+        _hashlib = hashlib
+    return _hashlib
+
+def _evp_ctor(name):
+    # hashlib.md5/sha256 are OpenSSL's EVP constructors, which pick the
+    # SHA-NI / AVX2 code paths for the running CPU by themselves. Called
+    # with the data they hash it in one C call; hashlib.new() would add a
+    # Python-level name lookup on every hash.
+    # usedforsecurity=False keeps MD5 available on FIPS builds (3.9+).
+    ctor = getattr(_get_hashlib(), name)
+    try:
+        ctor(usedforsecurity=False)
+    except TypeError:
+        return ctor
+    return functools.partial(ctor, usedforsecurity=False)
+
+_tree_pool = None
+
+def _tree_executor():
+    global _tree_pool
+    if _tree_pool is None:
+        from concurrent.futures import ThreadPoolExecutor
+        _tree_pool = ThreadPoolExecutor(max_workers=os.cpu_count() or 1)
+    return _tree_pool
+
+def _leaf_digest(view: memoryview) -> bytes:
+    # release before returning: an mmap can't close while views of it exist
+    with view:
+        return _hashers()["sha256"](view).digest()
+
+class TreeHash:
+    """Two-level SHA-256 tree: SHA-256 over the SHA-256 of each TREE_LEAF block.
+
+    NOT the same value as plain SHA-256 / sha256sum. Leaves are hashed on a
+    thread pool (hashlib releases the GIL), so big inputs use every core.
+    """
+    def __init__(self, data=b""):
+        self._pending = bytearray()
+        self._leaves = []
+        if data:
+            self.update(data)
+
+    def update(self, data):
+        # Slice only through memoryviews, never data[i:j]: on bytes or an
+        # mmap that copies every leaf. Only the sub-leaf tail is copied.
+        pool = _tree_executor()
+        with memoryview(data) as view:
+            if self._pending:
+                take = TREE_LEAF - len(self._pending)
+                self._pending += view[:take]
+                view = view[take:]
+                if len(self._pending) < TREE_LEAF:
+                    return
+                self._leaves.append(pool.submit(_leaf_digest, memoryview(self._pending)))
+                self._pending = bytearray()
+            whole = len(view) - len(view) % TREE_LEAF
+            for i in range(0, whole, TREE_LEAF):
+                self._leaves.append(pool.submit(_leaf_digest, view[i:i + TREE_LEAF]))
+            self._pending += view[whole:]
+
+    def digest(self) -> bytes:
+        leaves = [f.result() for f in self._leaves]
+        if self._pending or not leaves:
+            leaves.append(_leaf_digest(memoryview(self._pending)))
+        return _hashers()["sha256"](b"".join(leaves)).digest()
+
+    def hexdigest(self) -> str:
+        return self.digest().hex()
+
+def _new_blake3(data=b""):
+    if len(data) >= BLAKE3_MT_MIN:
+        return blake3.blake3(data, max_threads=blake3.blake3.AUTO)
+    return blake3.blake3(data)
+
+# algorithm choices offered in the GUI
+ALGORITHMS = ["sha256", "md5", "sha256-tree"]
+if blake3:
+    ALGORITHMS.append("blake3")
+if xxhash:
+    ALGORITHMS.append("xxh64")
+# what the combobox shows for choices whose key alone would mislead; the tree
+# digest is not what `sha256sum` prints, so it must not pass for SHA-256
+ALGO_LABELS = {"sha256-tree": "Parallel SHA-256 (tree, non-standard)"}
+
+_HASHERS = None
+
+def _hashers():
+    # hasher constructors keyed by the exact combobox values, resolved once
+    # on first use; like hashlib's, each accepts the first (or only) chunk
+    global _HASHERS
+    if _HASHERS is None:
+        table = {
+            "sha256": _evp_ctor("sha256"),
+            "md5": _evp_ctor("md5"),
+            "sha256-tree": TreeHash,
+        }
+        if blake3:
+            table["blake3"] = _new_blake3
+        if xxhash:
+            table["xxh64"] = xxhash.xxh64
+        _HASHERS = table
+    return _HASHERS
+
+# The helpers below return h.hexdigest() on purpose: for 16/32-byte digests
+# it formats in C and measured ~10% faster than h.digest().hex().
+def _hash_bytes(new, data) -> str:
+    return new(data).hexdigest()
+
+def _hash_text(new, text: str) -> str:
+    if len(text) <= HASH_CHUNK:
+        return new(text.encode("utf-8")).hexdigest()
+    # encode slice by slice so the full UTF-8 copy of the text never exists
+    h = new()
+    for i in range(0, len(text), HASH_CHUNK):
+        h.update(text[i:i + HASH_CHUNK].encode("utf-8"))
     return h.hexdigest()
 
+def _hash_path(new, path) -> str:
+    # hash straight from the page cache without copying the file into Python
+    with open(path, "rb") as f:
+        if not os.fstat(f.fileno()).st_size:  # mmap refuses empty files
+            return new().hexdigest()
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return new(mm).hexdigest()
+
+def _read_bytes(path, limit: int = -1):
+    # fill one preallocated buffer with readinto(): no grow-and-copy as f.read() does
+    with open(path, "rb", buffering=0) as f:
+        size = os.fstat(f.fileno()).st_size
+        buf = bytearray(size if limit < 0 else min(size, limit))
+        n = 0
+        with memoryview(buf) as view:
+            while n < len(buf):
+                got = f.readinto(view[n:])
+                if not got:
+                    break
+                n += got
+    del buf[n:]
+    return buf, size
+
+def compute_hash_bytes(data: bytes, algo: str) -> str:
+    return _hash_bytes(_hashers()[algo], data)
+
+def compute_hash_str(text: str, algo: str) -> str:
+    return _hash_text(_hashers()[algo], text)
+
 class HashGUI:
     def __init__(self, root):
         self.root = root
@@ -37,9 +209,15 @@ class HashGUI:
         top.pack(fill="x", padx=6, pady=6)
 
         ttk.Label(top, text="Algorithm:").pack(side="left")
-        self.algo_var = tk.StringVar(value="sha256")
-        algo_box = ttk.Combobox(top, textvariable=self.algo_var, values=["sha256","md5"], width=8, state="readonly")
+        # plain-Python copy of the selection so hashing needs no Tcl round-trip
+        self._algo = "sha256"
+        self.algo_var = tk.StringVar(value=self._algo)
+        self._algo_by_label = {ALGO_LABELS.get(a, a): a for a in ALGORITHMS}
+        algo_box = ttk.Combobox(top, textvariable=self.algo_var, values=list(self._algo_by_label), width=34, state="readonly")
         algo_box.pack(side="left", padx=(6,12))
+        # resolved once per selection (lazily, on the next hash) rather than per hash
+        self._hasher_factory = None
+        algo_box.bind("<<ComboboxSelected>>", self._on_algo_selected)
 
         ttk.Button(top, text="Open File...", command=self.open_file).pack(side="left", padx=6)
         ttk.Button(top, text="Clear", command=self.clear_text).pack(side="left", padx=6)
@@ -56,6 +234,23 @@ class HashGUI:
         self.text_widget = tk.Text(center, wrap="word", height=12)
         self.text_widget.pack(fill="both", expand=True, pady=(4,8))
         self.text_widget.focus_set()
+        self.text_widget.bind("<<Modified>>", self._on_text_modified)
+        self.text_widget.bind("<<Paste>>", self._on_paste)
+        # file whose bytes are hashed while the editor still shows it unedited
+        self._loaded_path = None
+        # UTF-8 of a big paste, hashed instead of the preview the editor shows
+        self._raw_bytes = None
+        # bumped on every edit; lets compute() tell whether the text changed
+        self._edits = 0
+        # LRU of recent digests keyed by (algorithm, input signature)
+        self._digest_cache = OrderedDict()
+        # hashing runs on worker threads that report back through this queue;
+        # only the newest job's result is shown
+        self._results = queue.Queue()
+        self._job = 0
+        self._pending = None
+        self._polling = False
+        self._spin = 0
 
         # result frame
         res_frame = ttk.Frame(center)
@@ -88,35 +283,185 @@ class HashGUI:
         status_bar = ttk.Label(root, textvariable=self.status, relief="sunken", anchor="w", padding=(6,4))
         status_bar.pack(fill="x", side="bottom")
 
+    def _on_algo_selected(self, event):
+        self._algo = self._algo_by_label[self.algo_var.get()]
+        self._hasher_factory = None
+
     def open_file(self):
         path = filedialog.askopenfilename(title="Open text file", filetypes=[("Text files", "*.txt *.md *.log *.csv"), ("All files", "*.*")])
         if not path:
             return
         try:
-            with open(path, "r", encoding="utf-8", errors="replace") as f:
-                content = f.read()
-            self.text_widget.delete("1.0", tk.END)
-            self.text_widget.insert(tk.END, content)
-            self.status.set(f"Loaded file: {Path(path).name}")
+            buf, size = _read_bytes(path, PREVIEW_BYTES)
+            # same newline handling the old text-mode read gave us
+            content = buf.decode("utf-8", errors="replace").replace("\r\n", "\n").replace("\r", "\n")
+            truncated = size > len(buf)
+            self._show_preview(content)
+            self._raw_bytes = None
+            self._loaded_path = Path(path)
+            note = " (preview only, full file is hashed)" if truncated else ""
+            self.status.set(f"Loaded file: {self._loaded_path.name}{note}")
         except Exception as e:
             messagebox.showerror("Open file", f"Failed to open file:\n{e}")
 
+    def _show_preview(self, content):
+        # one bulk insert with wrapping off, so Tk doesn't word-wrap the
+        # text while it is going in; wrapping is restored afterwards
+        self.text_widget.configure(wrap="none")
+        self.text_widget.delete("1.0", tk.END)
+        self.text_widget.insert("1.0", content)
+        self.text_widget.configure(wrap="word")
+        # programmatic load, not a user edit: keeps the file/paste hash path active
+        self.text_widget.edit_modified(False)
+        # ...but it is new input, so cached text/paste digests no longer apply
+        self._edits += 1
+        self._drop_pending()
+
+    def _on_paste(self, event):
+        try:
+            text = self.root.clipboard_get()
+        except tk.TclError:
+            return None  # nothing usable on the clipboard; let Tk deal with it
+        if len(text) <= BIG_PASTE_CHARS:
+            return None  # normal paste into the editor
+        # big paste replaces the input: encode once, show only the start
+        self._show_preview(text[:BIG_PASTE_CHARS])
+        self._loaded_path = None
+        # hash it the way the editor's text would be: Tk's get("1.0", END)
+        # always ends in "\n", so a paste of any size gives the same digest
+        raw = bytearray(text, "utf-8")
+        raw += b"\n"
+        self._raw_bytes = raw
+        self.status.set(f"Pasted {len(text):,} characters (preview only, full text is hashed)")
+        return "break"
+
+    def _on_text_modified(self, event):
+        if not self.text_widget.edit_modified():
+            return
+        # re-arm the flag so the next edit fires <<Modified>> again
+        self.text_widget.edit_modified(False)
+        # once the user edits the text, hash what they see instead of the file
+        self._loaded_path = None
+        self._raw_bytes = None
+        self._edits += 1
+        if self._drop_pending():
+            self.status.set("Input changed; hash cancelled")
+
+    def _drop_pending(self):
+        # forget the running hash job, if any: its input is gone, so its
+        # result must not land in the hash field. Returns whether one was dropped
+        dropped = self._pending is not None
+        self._pending = None
+        return dropped
+
+    def _input_sig(self):
+        # cheap identity of the current input; changes whenever its hash could
+        if self._loaded_path is not None:
+            st = self._loaded_path.stat()
+            return ("file", self._loaded_path, st.st_size, st.st_mtime_ns)
+        if self._raw_bytes is not None:
+            return ("paste", self._edits)
+        return ("text", self._edits)
+
     def clear_text(self):
         self.text_widget.delete("1.0", tk.END)
+        self._edits += 1  # an already-empty editor fires no <<Modified>>
+        self._loaded_path = None
+        self._raw_bytes = None
+        self._drop_pending()
         self.hash_var.set("")
         self.verify_var.set("")
         self.status.set("Cleared")
 
-    def compute(self):
-        raw = self.text_widget.get("1.0", tk.END)
-        if raw.strip() == "":
-            messagebox.showinfo("Compute", "Please enter or load some text to hash.")
+    def compute(self, on_done=None, display=True):
+        # on_done(digest) runs on the UI thread once the hash is ready;
+        # display=False leaves the hash field and status bar to the caller
+        algo = self._algo
+        path = self._loaded_path
+        raw = self._raw_bytes
+        try:
+            sig = self._input_sig()
+        except OSError as e:
+            messagebox.showerror("Compute", f"Failed to read file:\n{e}")
+            return
+        cached = self._digest_cache.get((algo, sig))
+        if cached is not None:
+            self._drop_pending()  # the newest request wins, even over a running job
+            self._hash_done(algo, path, sig, cached, on_done, display)
+            return
+        if path is None and raw is None:
+            raw = self.text_widget.get("1.0", tk.END)
+            # isspace() stops at the first visible character; strip() would copy
+            if not raw or raw.isspace():
+                messagebox.showinfo("Compute", "Please enter or load some text to hash.")
+                return
+        if self._hasher_factory is None:
+            self._hasher_factory = _hashers()[algo]
+        # hash off the Tk thread so the window stays responsive on big inputs
+        self._job += 1
+        self._pending = (self._job, algo, path, sig, on_done, display)
+        threading.Thread(target=self._hash_worker, args=(self._job, self._hasher_factory, path, raw), daemon=True).start()
+        if not self._polling:
+            self._polling = True
+            self.root.after(POLL_MS, self._poll_hash)
+
+    def _hash_worker(self, job, new, path, raw):
+        # worker thread: no Tk calls here, only the queue.
+        # raw is the editor text (str) or a big paste's bytes
+        try:
+            if path is not None:
+                digest = _hash_path(new, path)
+            elif isinstance(raw, str):
+                digest = _hash_text(new, raw)
+            else:
+                digest = _hash_bytes(new, raw)
+        except Exception as e:
+            self._results.put((job, None, e))
+        else:
+            self._results.put((job, digest, None))
+
+    def _poll_hash(self):
+        while True:
+            try:
+                job, digest, err = self._results.get_nowait()
+            except queue.Empty:
+                break
+            if self._pending is None or job != self._pending[0]:
+                continue  # cleared, or superseded by a newer Compute
+            _, algo, path, sig, on_done, display = self._pending
+            self._pending = None
+            self._polling = False
+            if err is not None:
+                self.status.set("Hashing failed")
+                messagebox.showerror("Compute", f"Failed to hash input:\n{err}")
+            else:
+                self._hash_done(algo, path, sig, digest, on_done, display)
+            return
+        if self._pending is None:
+            self._polling = False
             return
-        data = raw.encode("utf-8")
-        algo = self.algo_var.get()
-        digest = compute_hash_bytes(data, algo)
-        self.hash_var.set(digest)
-        self.status.set(f"Computed {algo.upper()} hash")
+        self._spin = (self._spin + 1) % len(SPINNER)
+        self.status.set(f"Hashing… {SPINNER[self._spin]}")
+        self.root.after(POLL_MS, self._poll_hash)
+
+    def _hash_done(self, algo, path, sig, digest, on_done=None, display=True):
+        key = (algo, sig)
+        self._digest_cache[key] = digest
+        self._digest_cache.move_to_end(key)
+        if len(self._digest_cache) > DIGEST_CACHE_SIZE:
+            self._digest_cache.popitem(last=False)
+        if display:
+            self.hash_var.set(digest)
+            name = ALGO_LABELS.get(algo, algo.upper())
+            if path is not None:
+                name += f" hash of {path.name}"
+            else:
+                name += " hash"
+            if algo == "sha256-tree":
+                name += " (will not match sha256sum)"
+            self.status.set(f"Computed {name}")
+        if on_done is not None:
+            on_done(digest)
 
     def copy_hash(self):
         val = self.hash_var.get().strip()
@@ -124,12 +469,9 @@ class HashGUI:
             messagebox.showinfo("Copy", "No hash to copy. Compute a hash first.")
             return
         try:
-            if pyperclip:
-                pyperclip.copy(val)
-            else:
-                # use Tk clipboard
-                self.root.clipboard_clear()
-                self.root.clipboard_append(val)
+            self.root.clipboard_clear()
+            self.root.clipboard_append(val)
+            self.root.update()  # keep on clipboard after the window closes
             self.status.set("Hash copied to clipboard")
         except Exception as e:
             messagebox.showwarning("Copy", f"Copy failed: {e}")
@@ -154,24 +496,44 @@ class HashGUI:
         if not path:
             return
         try:
-            with open(path, "r", encoding="utf-8", errors="replace") as f:
-                content = f.read().strip()
+            buf, _ = _read_bytes(path)
+            content = buf.decode("utf-8", errors="replace").strip()
             self.hash_var.set(content)
             self.status.set(f"Loaded hash from: {Path(path).name}")
         except Exception as e:
             messagebox.showerror("Load hash", f"Failed to load file:\n{e}")
 
     def verify(self):
-        provided = self.verify_var.get().strip().lower()
-        computed = self.hash_var.get().strip().lower()
+        provided = self.verify_var.get().strip()
+        computed = self.hash_var.get().strip()
         if not provided:
             messagebox.showinfo("Verify", "Enter a hash string in 'Verify against' field.")
             return
+        # fromhex folds case and rejects non-hex in one C pass, no lower() copies
+        try:
+            expected = bytes.fromhex(provided)
+        except ValueError:
+            messagebox.showerror("Verify", "'Verify against' must be a hexadecimal hash.")
+            return
         if not computed:
-            # compute if not present
-            self.compute()
-            computed = self.hash_var.get().strip().lower()
-        if provided == computed:
+            # compute if not present; the check finishes when the hash arrives
+            # hash and compare in one step, without displaying the digest first
+            self.compute(on_done=lambda digest: self._report_verify(expected, digest, fresh=True), display=False)
+            return
+        self._report_verify(expected, computed)
+
+    def _report_verify(self, expected, computed, fresh=False):
+        import hmac
+        try:
+            actual = bytes.fromhex(computed)
+        except ValueError:
+            messagebox.showerror("Verify", "The computed hash field does not hold a hexadecimal hash.")
+            return
+        # constant-time compare of the raw digest bytes
+        matched = hmac.compare_digest(expected, actual)
+        if fresh and (matched or SHOW_HASH_ON_MISMATCH):
+            self.hash_var.set(computed)
+        if matched:
             messagebox.showinfo("Verify", "Verification: MATCH ✅")
             self.status.set("Verification: MATCH")
         else:
@@ -31,35 +31,86 @@ MIT — Do whatever you like, but attribution appreciated.
 """
 from __future__ import annotations
 
+import functools
+import string
 import sys
 import tkinter as tk
+from concurrent.futures import ThreadPoolExecutor
 from tkinter import ttk, filedialog, messagebox
 from typing import Tuple
 
 APP_TITLE = "Caesar Cipher — Encoder / Decoder"
 APP_VERSION = "1.0.0"
+# quiet time after the last edit before the status-bar counts refresh (ms)
+COUNT_DEBOUNCE_MS = 150
+# how often the Tk thread checks on a background transform (ms)
+POLL_MS = 30
+# background transforms work through the text this many chars at a time
+WORKER_CHUNK = 1 << 20
+# loaded files are put into the input pane this many chars per event-loop turn
+INSERT_CHUNK = 1 << 20
+SPINNER = "|/-\\"
+# outputs longer than this are shown unwrapped (see _set_output_wrap)
+NOWRAP_CHARS = 65536
+# brute-force window: closes each shift's result
+_SEP = '\n' + '-' * 40 + '\n'
 
 # ---------------------------
 # Core Caesar/Digit functions
 # ---------------------------
 
-def _shift_alpha(ch: str, k: int, encode: bool = True) -> str:
-    if not ch.isalpha():
-        return ch
-    base = ord('A') if ch.isupper() else ord('a')
-    off = ord(ch) - base
-    k = k % 26
-    val = (off + k) % 26 if encode else (off - k) % 26
-    return chr(base + val)
+def _rotate(alphabet: str, k: int) -> str:
+    return alphabet[k:] + alphabet[:k]
 
 
-def _shift_digit(d: str, k: int, encode: bool = True) -> str:
-    if not d.isdigit():
-        return d
-    k = k % 10
-    off = ord(d) - ord('0')
-    val = (off + k) % 10 if encode else (off - k) % 10
-    return chr(ord('0') + val)
+@functools.lru_cache(maxsize=None)
+def _make_table(s26: int, s10: int, encode: bool, rotate_digits: bool) -> dict:
+    """Build the str.translate() table for one shift/mode combination.
+
+    There are at most 26 * 10 * 2 * 2 distinct tables, so all of them are
+    cached; brute force and repeated encodes reuse the same dicts.
+    """
+    if not encode:
+        s26, s10 = -s26 % 26, -s10 % 10
+    src = string.ascii_uppercase + string.ascii_lowercase
+    dst = _rotate(string.ascii_uppercase, s26) + _rotate(string.ascii_lowercase, s26)
+    if rotate_digits:
+        src += string.digits
+        dst += _rotate(string.digits, s10)
+    return str.maketrans(src, dst)
+
+
+@functools.lru_cache(maxsize=None)
+def _make_lut(s26: int, s10: int, encode: bool, rotate_digits: bool) -> bytes:
+    """Same mapping as _make_table, as a flat 256-byte bytes.translate() table."""
+    lut = bytearray(range(256))
+    for src, dst in _make_table(s26, s10, encode, rotate_digits).items():
+        lut[src] = dst
+    return bytes(lut)
+
+
+def _translate(text: str, table: dict, lut: bytes) -> str:
+    if text.isascii():
+        # str.translate has its own fast path for pure-ASCII strings; it beats
+        # encode('ascii') + bytes.translate(lut) + decode (~12 ms vs ~24 ms per
+        # 10 MB), so the byte LUT is only worth it for non-ASCII text
+        return text.translate(table)
+    # Anything else would hit str.translate's per-code-point slow path. The
+    # table only maps ASCII, and UTF-8 multi-byte sequences never contain
+    # ASCII bytes, so one flat LUT pass over the UTF-8 is exact (10x+ faster).
+    return text.encode('utf-8', 'surrogatepass').translate(lut).decode('utf-8', 'surrogatepass')
+
+
+# Decode tables for every shift, indexed [rotate_digits][k]; built once at
+# import so brute force is just 25 translate() passes.
+_DECODE_TABLES = tuple(
+    [_make_table(k % 26, k % 10, False, rot) for k in range(26)]
+    for rot in (False, True)
+)
+_DECODE_LUTS = tuple(
+    [_make_lut(k % 26, k % 10, False, rot) for k in range(26)]
+    for rot in (False, True)
+)
 
 
 def caesar_transform(text: str, shift: int, mode: str = 'encode', rotate_digits: bool = True) -> str:
@@ -72,18 +123,39 @@ def caesar_transform(text: str, shift: int, mode: str = 'encode', rotate_digits:
         rotate_digits: if True, rotate 0-9 by same shift
     """
     encode = (mode.lower() == 'encode')
-    out_chars = []
-    s26 = shift % 26
-    s10 = shift % 10
-
-    for ch in text:
-        if ch.isalpha():
-            out_chars.append(_shift_alpha(ch, s26, encode))
-        elif rotate_digits and ch.isdigit():
-            out_chars.append(_shift_digit(ch, s10, encode))
-        else:
-            out_chars.append(ch)
-    return ''.join(out_chars)
+    # one C-level pass over the text instead of a Python loop per character
+    key = (shift % 26, shift % 10, encode, bool(rotate_digits))
+    return _translate(text, _make_table(*key), _make_lut(*key))
+
+
+def _transform_in_chunks(text: str, shift: int, mode: str, rotate_digits: bool) -> str:
+    """caesar_transform for worker threads.
+
+    translate() holds the GIL for its whole run, so on one huge string the
+    Tk thread would stall just the same; between chunks it gets a turn.
+    """
+    if len(text) <= WORKER_CHUNK:
+        return caesar_transform(text, shift, mode, rotate_digits)
+    return ''.join([caesar_transform(text[i:i + WORKER_CHUNK], shift, mode, rotate_digits)
+                    for i in range(0, len(text), WORKER_CHUNK)])
+
+
+def caesar_bruteforce(text: str, rotate_digits: bool = True):
+    """Yield (shift, decoded text) for shifts 1-25.
+
+    Batched form of caesar_transform: non-ASCII text is encoded to UTF-8
+    once and every shift is a bytes.translate() over that same buffer.
+    """
+    # the per-shift tables are prebuilt, so each shift is a bare translate()
+    rot = bool(rotate_digits)
+    if text.isascii():
+        translate, tables = text.translate, _DECODE_TABLES[rot]
+        for k in range(1, 26):
+            yield k, translate(tables[k])
+        return
+    translate, luts = text.encode('utf-8', 'surrogatepass').translate, _DECODE_LUTS[rot]
+    for k in range(1, 26):
+        yield k, translate(luts[k]).decode('utf-8', 'surrogatepass')
 
 
 # ---------------------------
@@ -101,6 +173,9 @@ class CaesarApp(ttk.Frame):
         self.mode_var = tk.StringVar(value='encode')
         self.rotate_digits_var = tk.BooleanVar(value=True)
         self.theme_var = tk.StringVar(value='dark')  # default theme
+        self._count_job = None  # pending debounced update_counts
+        self._worker_pool = ThreadPoolExecutor(max_workers=2)
+        self._busy = False  # a pool job or a file load is running
 
         # Build UI
         self._setup_style()
@@ -174,7 +249,7 @@ class CaesarApp(ttk.Frame):
         m_edit.add_command(label='Paste to Input', accelerator=self._accel('V'), command=self.paste_to_input)
         m_edit.add_separator()
         m_edit.add_command(label='Select All (Input)', accelerator=self._accel('A'), command=lambda: self._select_all(self.input_text))
-        m_edit.add_command(label='Clear Input', command=lambda: self._clear_text(self.input_text))
+        m_edit.add_command(label='Clear Input', command=self.clear_input)
         m_edit.add_command(label='Clear Output', command=lambda: self._clear_text(self.output_text))
         mbar.add_cascade(label='Edit', menu=m_edit)
 
@@ -219,8 +294,10 @@ class CaesarApp(ttk.Frame):
         cb_digits.pack(side='left')
 
         # Action buttons
-        ttk.Button(top, text='Encode', style='Accent.TButton', command=self.encode).pack(side='right')
-        ttk.Button(top, text='Decode', command=self.decode).pack(side='right', padx=(0, 8))
+        self.encode_btn = ttk.Button(top, text='Encode', style='Accent.TButton', command=self.encode)
+        self.encode_btn.pack(side='right')
+        self.decode_btn = ttk.Button(top, text='Decode', command=self.decode)
+        self.decode_btn.pack(side='right', padx=(0, 8))
 
     # ---------- Text Panes ----------
     def _build_text_panes(self):
@@ -244,7 +321,10 @@ class CaesarApp(ttk.Frame):
         f_right = ttk.Frame(paned)
         self.output_text = tk.Text(f_right, wrap='word', undo=True)
         scroll_out = ttk.Scrollbar(f_right, command=self.output_text.yview)
-        self.output_text.configure(yscrollcommand=scroll_out.set)
+        # only packed while the output is unwrapped
+        self._scroll_out_x = ttk.Scrollbar(f_right, orient='horizontal', command=self.output_text.xview)
+        self.output_text.configure(yscrollcommand=scroll_out.set, xscrollcommand=self._scroll_out_x.set)
+        self._output_wrap_mode = 'word'
         ttk.Label(f_right, text='Output').pack(anchor='w', pady=(0, 4))
         self.output_text.pack(side='left', fill='both', expand=True)
         scroll_out.pack(side='right', fill='y')
@@ -260,40 +340,104 @@ class CaesarApp(ttk.Frame):
         self.statusbar.pack(fill='x', side='bottom')
         self.status_label = tk.Label(self.statusbar, anchor='w')
         self.status_label.pack(fill='x')
+        self._last_status = None  # text currently shown; see _set_status
 
     def update_counts(self, *_):
-        in_text = self._get_text(self.input_text)
-        out_text = self._get_text(self.output_text)
-        self.status_label.config(
-            text=f"Shift={self.shift_var.get()} | Mode={self.mode_var.get()} | RotateDigits={'On' if self.rotate_digits_var.get() else 'Off'}  ||  Input: {len(in_text)} chars  |  Output: {len(out_text)} chars"
+        n_in = self._char_count(self.input_text)
+        n_out = self._char_count(self.output_text)
+        shift, mode, rotate_digits = self._snapshot_state()
+        self._set_status(
+            f"Shift={'?' if shift is None else shift} | Mode={mode} | RotateDigits={'On' if rotate_digits else 'Off'}  ||  Input: {n_in} chars  |  Output: {n_out} chars"
         )
 
+    def _set_status(self, text: str):
+        # configuring a Label redraws it even when the text is the same
+        if text != self._last_status:
+            self.status_label.config(text=text)
+            self._last_status = text
+
+    def _snapshot_state(self) -> Tuple[int | None, str, bool]:
+        """Read all three controls once: (shift, mode, rotate_digits).
+
+        Each Variable.get() is a round trip through Tcl, so callers that need
+        only some of the values read just those (see _read_shift).
+        """
+        return self._read_shift(), self.mode_var.get(), self.rotate_digits_var.get()
+
+    def _read_shift(self) -> int | None:
+        # None if the spinbox doesn't hold an integer
+        try:
+            return int(self.shift_var.get())
+        except (ValueError, tk.TclError):
+            return None
+
     # ---------- Core Actions ----------
     def encode(self, *_):
-        try:
-            shift = int(self.shift_var.get())
-        except ValueError:
-            messagebox.showerror('Invalid Shift', 'Shift must be an integer (0–25).')
-            return
-        text = self._get_text(self.input_text)
-        res = caesar_transform(text, shift, 'encode', self.rotate_digits_var.get())
-        self._set_text(self.output_text, res)
-        self.mode_var.set('encode')
-        self.update_counts()
+        self._run_transform('encode')
 
     def decode(self, *_):
-        try:
-            shift = int(self.shift_var.get())
-        except ValueError:
+        self._run_transform('decode')
+
+    def _run_transform(self, mode: str):
+        if self._busy:
+            return  # e.g. Ctrl+E pressed again while the buttons are disabled
+        shift = self._read_shift()
+        if shift is None:
             messagebox.showerror('Invalid Shift', 'Shift must be an integer (0–25).')
             return
         text = self._get_text(self.input_text)
-        res = caesar_transform(text, shift, 'decode', self.rotate_digits_var.get())
+        self._submit(f"{mode.capitalize()}ing {len(text)} chars…",
+                     lambda fut: self._transform_done(fut, mode),
+                     _transform_in_chunks, text, shift, mode, self.rotate_digits_var.get())
+
+    def _transform_done(self, fut, mode: str):
+        res = fut.result()
+        self._set_output_wrap('none' if len(res) > NOWRAP_CHARS else 'word')
         self._set_text(self.output_text, res)
-        self.mode_var.set('decode')
+        self.mode_var.set(mode)
         self.update_counts()
 
+    def _submit(self, label: str, then, fn, *args):
+        """Run fn(*args) in the worker pool and call then(future) on the Tk thread.
+
+        The buttons stay disabled and the status bar shows a spinner with
+        label until the job finishes.
+        """
+        fut = self._worker_pool.submit(fn, *args)
+        self._set_busy(True)
+        self._poll(fut, label, then, 0)
+
+    def _poll(self, fut, label: str, then, tick: int):
+        if not fut.done():
+            self._set_status(f"{label} {SPINNER[tick % len(SPINNER)]}")
+            self.master.after(POLL_MS, self._poll, fut, label, then, tick + 1)
+            return
+        self._set_busy(False)
+        self.update_counts()  # replaces the spinner
+        then(fut)
+
+    def _set_output_wrap(self, mode: str):
+        # Word-wrapping makes Tk measure every line on insert, which dominates
+        # for big outputs. Unwrapped they go in much faster, at the cost of
+        # scrolling sideways to read long lines.
+        if mode == self._output_wrap_mode:
+            return
+        self._output_wrap_mode = mode
+        self.output_text.configure(wrap=mode)
+        if mode == 'none':
+            self._scroll_out_x.pack(side='bottom', fill='x', before=self.output_text)
+        else:
+            self._scroll_out_x.pack_forget()
+
+    def _set_busy(self, busy: bool):
+        self._busy = busy
+        flag = 'disabled' if busy else '!disabled'
+        self.encode_btn.state([flag])
+        self.decode_btn.state([flag])
+
     def bruteforce(self, *_):
+        if self._busy:
+            return  # the input may still be loading
         text = self._get_text(self.input_text)
         if not text.strip():
             messagebox.showinfo('Brute Force', 'Type or paste some cipher text into the Input pane first.')
@@ -301,21 +445,44 @@ class CaesarApp(ttk.Frame):
         w = tk.Toplevel(self.master)
         w.title('Brute Force — Try All Shifts (1–25)')
         w.geometry('720x520')
-        txt = tk.Text(w, wrap='word')
+        # no word-wrap: wrapping every long line is what makes big inserts slow
+        txt = tk.Text(w, wrap='none')
         scr = ttk.Scrollbar(w, command=txt.yview)
-        txt.configure(yscrollcommand=scr.set)
+        xscr = ttk.Scrollbar(w, orient='horizontal', command=txt.xview)
+        txt.configure(yscrollcommand=scr.set, xscrollcommand=xscr.set)
+        xscr.pack(side='bottom', fill='x')
         txt.pack(side='left', fill='both', expand=True)
         scr.pack(side='right', fill='y')
-
-        rotate_digits = self.rotate_digits_var.get()
-        lines = []
-        for k in range(1, 26):
-            res = caesar_transform(text, k, 'decode', rotate_digits)
-            lines.append(f"Shift {k:2d}:\n{res}\n{'-'*40}\n")
-        txt.insert('1.0', ''.join(lines))
         txt.focus_set()
 
+        results = caesar_bruteforce(text, self.rotate_digits_var.get())
+
+        # each shift is decoded in the pool and inserted on the next poll, so
+        # the window fills in progressively and only one result is held at a time
+        def _step(fut=None):
+            if not txt.winfo_exists():
+                return  # window closed early
+            if fut is None:
+                fut = self._worker_pool.submit(next, results, None)
+            if not fut.done():
+                self.master.after(POLL_MS, _step, fut)
+                return
+            item = fut.result()
+            if item is None:
+                w.title('Brute Force — Try All Shifts (1–25)')
+                return
+            k, res = item
+            w.title(f'Brute Force — Shift {k}/25…')
+            # header, result and separator go in as separate segments of one
+            # insert, so the (input-sized) result is never copied into a new string
+            txt.insert('end', f"Shift {k:2d}:\n", (), res, (), _SEP)
+            self.master.after(1, _step)
+
+        self.master.after(1, _step)
+
     def swap_panes(self, *_):
+        if self._busy:
+            return
         a = self._get_text(self.input_text)
         b = self._get_text(self.output_text)
         self._set_text(self.input_text, b)
@@ -327,50 +494,100 @@ class CaesarApp(ttk.Frame):
 
     # ---------- File Ops ----------
     def open_file(self, *_):
+        if self._busy:
+            return
         path = filedialog.askopenfilename(title='Open Text File', filetypes=[('Text Files', '*.txt'), ('All Files', '*.*')])
         if not path:
             return
+        self._submit('Opening…', lambda fut: self._open_done(fut, path), self._read_file, path)
+
+    def _open_done(self, fut, path: str):
         try:
-            with open(path, 'r', encoding='utf-8') as f:
-                data = f.read()
+            data = fut.result()
         except Exception as e:
             messagebox.showerror('Open Failed', f'Could not read file:\n{e}')
             return
-        self._set_text(self.input_text, data)
-        self.update_counts()
+        self._set_text(self.input_text, '')
+        w = self.input_text
+        name = path.rsplit('/', 1)[-1]  # Tk's file dialogs always use '/'
+        # read-only until the whole file is in; every other action that
+        # touches the input checks _busy
+        w.configure(undo=False, state='disabled')
+        self._set_busy(True)
+
+        def _finish(note: str = ''):
+            w.configure(undo=True, state='normal')
+            w.edit_reset()
+            self._set_busy(False)
+            self.update_counts()
+            if note:
+                messagebox.showwarning('Open', note)
+
+        # a whole file in one insert would block the event loop, so it goes
+        # in INSERT_CHUNK characters per turn
+        def _insert_chunk(pos=0, end='1.0'):
+            if w.index('end-1c') != end:
+                # something else wrote to the pane between chunks; appending
+                # the rest would splice the file onto it
+                _finish(f'Loading {name} was interrupted; the Input pane holds only part of it.')
+                return
+            w.configure(state='normal')
+            w.insert('end-1c', data[pos:pos + INSERT_CHUNK])
+            w.configure(state='disabled')
+            pos += INSERT_CHUNK
+            if pos < len(data):
+                self._set_status(f"Loading {name}… {pos * 100 // len(data)}%")
+                self.master.after(1, _insert_chunk, pos, w.index('end-1c'))
+                return
+            _finish()
+
+        _insert_chunk()
 
     def save_output(self, *_):
+        if self._busy:
+            return
         path = filedialog.asksaveasfilename(title='Save Output', defaultextension='.txt', filetypes=[('Text Files', '*.txt')])
         if not path:
             return
-        try:
-            with open(path, 'w', encoding='utf-8') as f:
-                f.write(self._get_text(self.output_text))
-        except Exception as e:
-            messagebox.showerror('Save Failed', f'Could not save file:\n{e}')
-            return
-        messagebox.showinfo('Saved', f'Output saved to:\n{path}')
+
+        def _done(fut):
+            try:
+                fut.result()
+            except Exception as e:
+                messagebox.showerror('Save Failed', f'Could not save file:\n{e}')
+                return
+            messagebox.showinfo('Saved', f'Output saved to:\n{path}')
+
+        self._submit('Saving…', _done, self._write_file, path, self._get_text(self.output_text))
 
     def save_both(self, *_):
+        if self._busy:
+            return
         path_in = filedialog.asksaveasfilename(title='Save Input As…', defaultextension='.txt', filetypes=[('Text Files', '*.txt')])
         if not path_in:
             return
-        try:
-            with open(path_in, 'w', encoding='utf-8') as f:
-                f.write(self._get_text(self.input_text))
-        except Exception as e:
-            messagebox.showerror('Save Failed', f'Could not save input:\n{e}')
-            return
-        path_out = filedialog.asksaveasfilename(title='Save Output As…', defaultextension='.txt', filetypes=[('Text Files', '*.txt')])
-        if not path_out:
-            return
-        try:
-            with open(path_out, 'w', encoding='utf-8') as f:
-                f.write(self._get_text(self.output_text))
-        except Exception as e:
-            messagebox.showerror('Save Failed', f'Could not save output:\n{e}')
-            return
-        messagebox.showinfo('Saved', f'Saved both files.\nInput → {path_in}\nOutput → {path_out}')
+
+        def _input_done(fut):
+            try:
+                fut.result()
+            except Exception as e:
+                messagebox.showerror('Save Failed', f'Could not save input:\n{e}')
+                return
+            path_out = filedialog.asksaveasfilename(title='Save Output As…', defaultextension='.txt', filetypes=[('Text Files', '*.txt')])
+            if not path_out:
+                return
+
+            def _output_done(fut):
+                try:
+                    fut.result()
+                except Exception as e:
+                    messagebox.showerror('Save Failed', f'Could not save output:\n{e}')
+                    return
+                messagebox.showinfo('Saved', f'Saved both files.\nInput → {path_in}\nOutput → {path_out}')
+
+            self._submit('Saving output…', _output_done, self._write_file, path_out, self._get_text(self.output_text))
+
+        self._submit('Saving input…', _input_done, self._write_file, path_in, self._get_text(self.input_text))
 
     def copy_output(self, *_):
         text = self._get_text(self.output_text)
@@ -385,11 +602,12 @@ class CaesarApp(ttk.Frame):
             text = self.master.clipboard_get()
         except Exception:
             text = ''
-        if text:
+        if text and not self._busy:
             self.input_text.insert('insert', text)
             self.update_counts()
 
     def quit_app(self, *_):
+        self._worker_pool.shutdown(wait=False)
         self.master.quit()
 
     # ---------- Help ----------
@@ -431,16 +649,50 @@ class CaesarApp(ttk.Frame):
     def _on_modified(self, event):
         widget = event.widget
         widget.edit_modified(False)  # reset flag
+        # coalesce bursts of keystrokes into one refresh once typing pauses
+        if self._count_job is not None:
+            self.master.after_cancel(self._count_job)
+        self._count_job = self.master.after(COUNT_DEBOUNCE_MS, self._debounced_counts)
+
+    def _debounced_counts(self):
+        self._count_job = None
+        if self._busy:
+            return  # keep the progress text; counts are refreshed when the job ends
         self.update_counts()
 
+    @staticmethod
+    def _char_count(w: tk.Text) -> int:
+        # counted inside Tk; no copy of the whole buffer into Python
+        n = w.count('1.0', 'end-1c', 'chars')
+        return n[0] if n else 0
+
+    @staticmethod
+    def _read_file(path: str) -> str:
+        with open(path, 'r', encoding='utf-8') as f:
+            return f.read()
+
+    @staticmethod
+    def _write_file(path: str, text: str):
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(text)
+
     @staticmethod
     def _get_text(w: tk.Text) -> str:
         return w.get('1.0', 'end-1c')
 
     @staticmethod
     def _set_text(w: tk.Text, text: str):
-        w.delete('1.0', 'end')
-        w.insert('1.0', text)
+        # one replace = one re-layout; with undo off the old and new text are
+        # not copied onto the undo stack, and the stale history is dropped
+        undo = w.cget('undo')
+        w.configure(undo=False)
+        w.replace('1.0', 'end-1c', text)
+        w.configure(undo=undo)
+        w.edit_reset()
+
+    def clear_input(self, *_):
+        if not self._busy:
+            self._clear_text(self.input_text)
 
     @staticmethod
     def _clear_text(w: tk.Text):
@@ -6,6 +6,7 @@ Requirements: Python 3.6+ (no external libs required). Optional: pyperclip for c
 """
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
+import functools
 import secrets
 import string
 import math
@@ -17,6 +18,9 @@ try:
 except Exception:
     _HAS_PYPERCLIP = False
 
+# CSPRNG (os.urandom-backed) with random's C-level shuffle/choices helpers
+_SR = secrets.SystemRandom()
+
 # Character sets
 LOWER = string.ascii_lowercase
 UPPER = string.ascii_uppercase
@@ -24,8 +28,12 @@ DIGITS = string.digits
 SYMBOLS = "!@#$%^&*()-_=+[]{};:,.<>/?"
 # Ambiguous characters to optionally exclude
 AMBIG = "Il1O0"
+_AMBIG_DELETE = str.maketrans('', '', AMBIG)
 
-def build_charset(include_lower, include_upper, include_digits, include_symbols, exclude_ambig):
+# only 32 combinations of the five options, so results are cached and
+# returned as immutable tuples that callers can share
+@functools.lru_cache(maxsize=32)
+def _cached_charset(include_lower, include_upper, include_digits, include_symbols, exclude_ambig):
     parts = []
     if include_lower: parts.append(LOWER)
     if include_upper: parts.append(UPPER)
@@ -33,44 +41,78 @@ def build_charset(include_lower, include_upper, include_digits, include_symbols,
     if include_symbols: parts.append(SYMBOLS)
     charset = ''.join(parts)
     if exclude_ambig:
-        charset = ''.join(ch for ch in charset if ch not in AMBIG)
-    return charset, parts  # parts used to guarantee one char of each selected category
+        charset = charset.translate(_AMBIG_DELETE)
+    return charset, tuple(parts)
 
-def ensure_each_category(chosen_parts, exclude_ambig):
-    # return parts with ambiguous removed if needed
+def build_charset(include_lower, include_upper, include_digits, include_symbols, exclude_ambig):
+    # parts used to guarantee one char of each selected category
+    return _cached_charset(bool(include_lower), bool(include_upper), bool(include_digits),
+                           bool(include_symbols), bool(exclude_ambig))
+
+@functools.lru_cache(maxsize=32)
+def _cached_categories(chosen_parts, exclude_ambig):
     out = []
     for p in chosen_parts:
         if exclude_ambig:
-            out.append(''.join(ch for ch in p if ch not in AMBIG))
+            out.append(p.translate(_AMBIG_DELETE))
         else:
             out.append(p)
-    return out
+    return tuple(out)
+
+def ensure_each_category(chosen_parts, exclude_ambig):
+    # return parts with ambiguous removed if needed
+    return _cached_categories(tuple(chosen_parts), bool(exclude_ambig))
 
 def generate_password(length, include_lower, include_upper, include_digits, include_symbols, exclude_ambig):
     charset, parts = build_charset(include_lower, include_upper, include_digits, include_symbols, exclude_ambig)
     if not charset:
         raise ValueError("Enable at least one character category.")
-    parts = ensure_each_category(parts, exclude_ambig)
+    parts_nonempty = [p for p in ensure_each_category(parts, exclude_ambig) if p]
+    if length < len(parts_nonempty):
+        # too short for one of each category: plain random from the whole charset
+        return ''.join(_SR.choices(charset, k=length))
     # build password ensuring at least one char from each selected category
-    required = [secrets.choice(p) for p in parts if p]  # one from each non-empty selected category
-    if len(required) > length:
-        # if user asked length smaller than number of categories, just shuffle required and return truncated
-        pwd = ''.join(secrets.choice(charset) for _ in range(length - 0))  # fallback
-        return pwd
+    required = [secrets.choice(p) for p in parts_nonempty]
     remaining = length - len(required)
-    others = [secrets.choice(charset) for _ in range(remaining)]
+    others = _SR.choices(charset, k=remaining)
     combined = required + others
     # shuffle securely
-    for i in range(len(combined)-1, 0, -1):
-        j = secrets.randbelow(i+1)
-        combined[i], combined[j] = combined[j], combined[i]
+    _SR.shuffle(combined)
     return ''.join(combined)
 
+def generate_passwords(count, length, include_lower, include_upper, include_digits, include_symbols, exclude_ambig):
+    # same distribution as calling generate_password count times, but all the
+    # filler characters come from a single choices() call
+    charset, parts = build_charset(include_lower, include_upper, include_digits, include_symbols, exclude_ambig)
+    if not charset:
+        raise ValueError("Enable at least one character category.")
+    if length <= 0:
+        return [''] * count  # what generate_password gives for such lengths
+    parts = [p for p in ensure_each_category(parts, exclude_ambig) if p]
+    bulk = _SR.choices(charset, k=count * length)
+    if len(parts) > length:
+        # too short for one of each category: plain random, as in generate_password
+        parts = []
+    positions = range(length)
+    results = []
+    for r in range(0, count * length, length):
+        # one char of each category goes to a random distinct position
+        for i, p in zip(_SR.sample(positions, len(parts)), parts):
+            bulk[r + i] = _SR.choice(p)
+        results.append(''.join(bulk[r:r + length]))
+    return results
+
+# charset_size -> log2(charset_size), filled in as sizes are seen
+_LOG2_CACHE = {}
+
 def estimate_entropy(length, charset_size):
     # approximate entropy in bits: length * log2(charset_size)
     if charset_size <= 0:
         return 0.0
-    return length * math.log2(charset_size)
+    bits = _LOG2_CACHE.get(charset_size)
+    if bits is None:
+        bits = _LOG2_CACHE[charset_size] = math.log2(charset_size)
+    return length * bits
 
 def strength_label(entropy_bits):
     # Simple categorization
@@ -163,10 +205,7 @@ class PassGenApp:
                 messagebox.showwarning("No character set", "Choose at least one character category.")
                 return
             # generate multiple
-            results = []
-            for _ in range(count):
-                pwd = generate_password(length, inc_lower, inc_upper, inc_digits, inc_symbols, excl_amb)
-                results.append(pwd)
+            results = generate_passwords(count, length, inc_lower, inc_upper, inc_digits, inc_symbols, excl_amb)
             # display
             self.text.delete("1.0", tk.END)
             self.text.insert(tk.END, "\n".join(results))